@@ -18,7 +18,11 @@ from pydantic_deep.toolsets.filesystem import (
     create_filesystem_toolset,
     get_filesystem_system_prompt,
 )
-from pydantic_deep.toolsets.skills import create_skills_toolset, get_skills_system_prompt
+from pydantic_deep.toolsets.skills import (
+    create_skills_toolset,
+    discover_skills,
+    get_skills_system_prompt,
+)
 from pydantic_deep.toolsets.subagents import create_subagent_toolset, get_subagent_system_prompt
 from pydantic_deep.types import Skill, SkillDirectory, SubAgentConfig
 
@@ -243,6 +247,9 @@ def create_deep_agent(  # noqa: C901
     # Skills toolset
     loaded_skills: list[Skill] = []
     if include_skills:
+        if skills is None and skill_directories:
+            # Walk the directories once and share the result with the toolset
+            skills = discover_skills(skill_directories)
         skills_toolset = create_skills_toolset(
             id="deep-skills",
             directories=skill_directories,
@@ -250,12 +257,7 @@ def create_deep_agent(  # noqa: C901
         )
         all_toolsets.append(skills_toolset)
         # Track loaded skills for system prompt
-        if skills:
-            loaded_skills = skills
-        elif skill_directories:
-            from pydantic_deep.toolsets.skills import discover_skills
-
-            loaded_skills = discover_skills(skill_directories)
+        loaded_skills = skills or []
 
     # Add user-provided toolsets
     if toolsets:
@@ -299,10 +301,15 @@ def create_deep_agent(  # noqa: C901
         **agent_create_kwargs,
     )
 
+    # The skills section only depends on the skills known at creation time,
+    # so it is rendered once and reused for every model request.
+    skills_prompt: str | None = None
+
     # Add dynamic system prompts
     @agent.instructions
     def dynamic_instructions(ctx: Any) -> str:  # pragma: no cover
         """Generate dynamic instructions based on current state."""
+        nonlocal skills_prompt
         parts = []
 
         # Show uploaded files first (most relevant for user's current task)
@@ -326,7 +333,8 @@ def create_deep_agent(  # noqa: C901
                 parts.append(subagent_prompt)
 
         if include_skills and loaded_skills:
-            skills_prompt = get_skills_system_prompt(ctx.deps, loaded_skills)
+            if skills_prompt is None:
+                skills_prompt = get_skills_system_prompt(ctx.deps, loaded_skills)
             if skills_prompt:
                 parts.append(skills_prompt)
 
@@ -14,6 +14,13 @@ from pydantic_deep.types import FileData, Todo, UploadedFile
 if TYPE_CHECKING:
     pass
 
+# Checkbox shown for each todo status in the system prompt
+_TODO_STATUS_ICONS: dict[str, str] = {
+    "pending": "[ ]",
+    "in_progress": "[*]",
+    "completed": "[x]",
+}
+
 
 @dataclass
 class DeepAgentDeps:
@@ -52,11 +59,7 @@ class DeepAgentDeps:
 
         lines = ["## Current Todos"]
         for todo in self.todos:
-            status_icon = {
-                "pending": "[ ]",
-                "in_progress": "[*]",
-                "completed": "[x]",
-            }.get(todo.status, "[ ]")
+            status_icon = _TODO_STATUS_ICONS.get(todo.status, "[ ]")
             lines.append(f"- {status_icon} {todo.content}")
 
         return "\n".join(lines)
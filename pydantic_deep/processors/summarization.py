@@ -105,8 +105,9 @@ def _format_request_parts(msg: ModelRequest) -> list[str]:  # pragma: no branch
         elif isinstance(part, SystemPromptPart):
             lines.append(f"System: {part.content}")
         elif isinstance(part, ToolReturnPart):
-            content_str = str(part.content)[:500]
-            if len(str(part.content)) > 500:
+            content = str(part.content)
+            content_str = content[:500]
+            if len(content) > 500:
                 content_str += "..."
             lines.append(f"Tool [{part.tool_name}]: {content_str}")
     return lines
@@ -148,6 +149,17 @@ def _format_messages_for_summary(messages: Sequence[ModelMessage]) -> str:  # pr
     return "\n".join(lines)
 
 
+def _index_tool_returns(messages: Sequence[ModelMessage]) -> dict[str, list[int]]:
+    """Map each tool call ID to the indices of the requests that return it."""
+    index: dict[str, list[int]] = {}
+    for i, msg in enumerate(messages):
+        if isinstance(msg, ModelRequest):
+            for part in msg.parts:
+                if isinstance(part, ToolReturnPart):
+                    index.setdefault(part.tool_call_id, []).append(i)
+    return index
+
+
 @dataclass
 class SummarizationProcessor:
     """History processor that summarizes conversation when limits are reached.
@@ -305,8 +317,9 @@ class SummarizationProcessor:
             cutoff_candidate = max(0, len(messages) - 1)
 
         # Find a safe cutoff point (not splitting tool call pairs)
+        tool_return_index = _index_tool_returns(messages)
         for i in range(cutoff_candidate, -1, -1):  # pragma: no branch
-            if self._is_safe_cutoff_point(messages, i):
+            if self._is_safe_cutoff_point(messages, i, tool_return_index):
                 return i
 
         return 0  # pragma: no cover
@@ -317,18 +330,31 @@ class SummarizationProcessor:
             return 0
 
         target_cutoff = len(messages) - messages_to_keep
+        tool_return_index = _index_tool_returns(messages)
 
         for i in range(target_cutoff, -1, -1):
-            if self._is_safe_cutoff_point(messages, i):
+            if self._is_safe_cutoff_point(messages, i, tool_return_index):
                 return i
 
         return 0  # pragma: no cover
 
-    def _is_safe_cutoff_point(self, messages: list[ModelMessage], cutoff_index: int) -> bool:
-        """Check if cutting at index would separate AI/Tool message pairs."""
+    def _is_safe_cutoff_point(
+        self,
+        messages: list[ModelMessage],
+        cutoff_index: int,
+        tool_return_index: dict[str, list[int]] | None = None,
+    ) -> bool:
+        """Check if cutting at index would separate AI/Tool message pairs.
+
+        Callers probing several cutoffs over the same messages should pass a
+        prebuilt `tool_return_index` so the messages are only scanned once.
+        """
         if cutoff_index >= len(messages):
             return True
 
+        if tool_return_index is None:
+            tool_return_index = _index_tool_returns(messages)
+
         search_start = max(0, cutoff_index - _SEARCH_RANGE_FOR_TOOL_PAIRS)
         search_end = min(len(messages), cutoff_index + _SEARCH_RANGE_FOR_TOOL_PAIRS)
 
@@ -337,27 +363,15 @@ class SummarizationProcessor:
             if not isinstance(msg, ModelResponse):
                 continue
 
-            tool_call_ids: set[str] = set()
+            tool_before_cutoff = i < cutoff_index
             for part in msg.parts:
-                if isinstance(part, ToolCallPart) and part.tool_call_id:
-                    tool_call_ids.add(part.tool_call_id)
-
-            if not tool_call_ids:
-                continue
+                if not isinstance(part, ToolCallPart) or not part.tool_call_id:
+                    continue
 
-            # Check if cutoff separates this tool call from its response
-            for j in range(i + 1, len(messages)):
-                check_msg = messages[j]
-                if isinstance(check_msg, ModelRequest):
-                    for request_part in check_msg.parts:
-                        if (
-                            isinstance(request_part, ToolReturnPart)
-                            and request_part.tool_call_id in tool_call_ids
-                        ):
-                            tool_before_cutoff = i < cutoff_index
-                            response_before_cutoff = j < cutoff_index
-                            if tool_before_cutoff != response_before_cutoff:
-                                return False
+                # Check if cutoff separates this tool call from its response
+                for j in tool_return_index.get(part.tool_call_id, ()):
+                    if j > i and (j < cutoff_index) != tool_before_cutoff:
+                        return False
 
         return True
 
@@ -11,6 +11,7 @@ instructions are loaded on-demand when the agent needs them.
 from __future__ import annotations
 
 import re
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -27,6 +28,9 @@ if TYPE_CHECKING:
 # Default skills directory (can be overridden)
 DEFAULT_SKILLS_DIR = "~/.pydantic-deep/skills"
 
+# YAML frontmatter between --- delimiters at the start of SKILL.md
+_FRONTMATTER_PATTERN = re.compile(r"^---\s*\n(.*?)\n---\s*\n?", re.DOTALL)
+
 
 def parse_skill_md(content: str) -> tuple[dict[str, Any], str]:
     """Parse a SKILL.md file into frontmatter and instructions.
@@ -37,9 +41,7 @@ def parse_skill_md(content: str) -> tuple[dict[str, Any], str]:
     Returns:
         Tuple of (frontmatter_dict, instructions_markdown).
     """
-    # Match YAML frontmatter between --- delimiters
-    frontmatter_pattern = r"^---\s*\n(.*?)\n---\s*\n?"
-    match = re.match(frontmatter_pattern, content, re.DOTALL)
+    match = _FRONTMATTER_PATTERN.match(content)
 
     if not match:
         # No frontmatter, treat entire content as instructions
@@ -92,21 +94,21 @@ def parse_skill_md(content: str) -> tuple[dict[str, Any], str]:
     return frontmatter, instructions
 
 
-def discover_skills(
+def iter_skills(
     directories: list[SkillDirectory],
     backend: Any | None = None,
-) -> list[Skill]:
-    """Discover skills from the filesystem.
+) -> Iterator[Skill]:
+    """Discover skills from the filesystem, yielding them one at a time.
+
+    Each SKILL.md is parsed only when the next skill is requested.
 
     Args:
         directories: List of directories to search for skills.
         backend: Optional backend for virtual filesystem support.
 
-    Returns:
-        List of discovered skills (frontmatter only).
+    Yields:
+        Discovered skills (frontmatter only).
     """
-    skills: list[Skill] = []
-
     for skill_dir in directories:
         dir_path = Path(skill_dir["path"]).expanduser()
         recursive = skill_dir.get("recursive", True)
@@ -146,13 +148,27 @@ def discover_skills(
                 if resources:
                     skill["resources"] = resources
 
-                skills.append(skill)
-
             except Exception:  # pragma: no cover
                 # Skip invalid skill files
                 continue
 
-    return skills
+            yield skill
+
+
+def discover_skills(
+    directories: list[SkillDirectory],
+    backend: Any | None = None,
+) -> list[Skill]:
+    """Discover skills from the filesystem.
+
+    Args:
+        directories: List of directories to search for skills.
+        backend: Optional backend for virtual filesystem support.
+
+    Returns:
+        List of discovered skills (frontmatter only).
+    """
+    return list(iter_skills(directories, backend))
 
 
 def load_skill_instructions(skill_path: str) -> str:
@@ -207,13 +223,71 @@ def get_skills_system_prompt(
     return "\n".join(lines)
 
 
+def _format_skills_list(skills: dict[str, Skill]) -> str:
+    """Format the skills listing returned by the list_skills tool.
+
+    Args:
+        skills: Available skills keyed by name.
+
+    Returns:
+        Formatted list of available skills.
+    """
+    if not skills:
+        return "No skills available."
+
+    lines = ["Available Skills:", ""]
+
+    for name, skill in sorted(skills.items()):
+        tags_str = ", ".join(skill["tags"]) if skill["tags"] else "none"
+        resources_str = ""
+        if skill.get("resources"):
+            resources_str = f" (resources: {', '.join(skill['resources'])})"
+
+        lines.append(f"**{name}** (v{skill['version']})")
+        lines.append(f"  Description: {skill['description']}")
+        lines.append(f"  Tags: {tags_str}")
+        lines.append(f"  Path: {skill['path']}{resources_str}")
+        lines.append("")
+
+    return "\n".join(lines)
+
+
+def _get_skill_instructions(skill: Skill) -> str:
+    """Return a skill's full instructions, loading and caching them on first use.
+
+    Once read, instructions are reused for the life of the toolset, so later
+    edits to SKILL.md are not picked up. A missing SKILL.md is not cached and
+    is looked up again on the next call.
+
+    Args:
+        skill: Skill to load instructions for. Updated in place on success.
+
+    Returns:
+        Full markdown instructions, or an error message if SKILL.md is missing.
+    """
+    instructions = skill.get("instructions")
+    if instructions is not None:
+        return instructions
+
+    skill_file = Path(skill["path"]) / "SKILL.md"
+    if not skill_file.exists():
+        return f"Error: SKILL.md not found at {skill['path']}"
+
+    _, instructions = parse_skill_md(skill_file.read_text())
+
+    # Update cache with full instructions
+    skill["instructions"] = instructions
+    skill["frontmatter_loaded"] = False
+    return instructions
+
+
 class SkillsToolset(FunctionToolset[DeepAgentDeps]):
     """Toolset for skills functionality."""
 
     pass
 
 
-def create_skills_toolset(  # noqa: C901
+def create_skills_toolset(
     *,
     id: str = "skills",
     directories: list[SkillDirectory] | None = None,
@@ -232,14 +306,20 @@ def create_skills_toolset(  # noqa: C901
     toolset = SkillsToolset(id=id)
 
     # Discover or use provided skills
-    if skills is None and directories:
-        skills = discover_skills(directories)
-    elif skills is None:
+    source: Iterable[Skill]
+    if skills is not None:
+        source = skills
+    elif directories:
+        source = iter_skills(directories)
+    else:
         # Default skills directory
-        skills = discover_skills([{"path": DEFAULT_SKILLS_DIR, "recursive": True}])
+        source = iter_skills([{"path": DEFAULT_SKILLS_DIR, "recursive": True}])
 
     # Store skills in toolset for access by tools
-    _skills_cache: dict[str, Skill] = {skill["name"]: skill for skill in (skills or [])}
+    _skills_cache: dict[str, Skill] = {skill["name"]: skill for skill in source}
+
+    # Rendered on first use; load_skill never changes the listed fields
+    _skills_listing: str | None = None
 
     @toolset.tool
     async def list_skills(ctx: RunContext[DeepAgentDeps]) -> str:  # pragma: no cover
@@ -251,24 +331,10 @@ def create_skills_toolset(  # noqa: C901
         Returns:
             Formatted list of available skills.
         """
-        if not _skills_cache:
-            return "No skills available."
-
-        lines = ["Available Skills:", ""]
-
-        for name, skill in sorted(_skills_cache.items()):
-            tags_str = ", ".join(skill["tags"]) if skill["tags"] else "none"
-            resources_str = ""
-            if skill.get("resources"):
-                resources_str = f" (resources: {', '.join(skill['resources'])})"
-
-            lines.append(f"**{name}** (v{skill['version']})")
-            lines.append(f"  Description: {skill['description']}")
-            lines.append(f"  Tags: {tags_str}")
-            lines.append(f"  Path: {skill['path']}{resources_str}")
-            lines.append("")
-
-        return "\n".join(lines)
+        nonlocal _skills_listing
+        if _skills_listing is None:
+            _skills_listing = _format_skills_list(_skills_cache)
+        return _skills_listing
 
     @toolset.tool
     async def load_skill(  # pragma: no cover
@@ -278,7 +344,8 @@ def create_skills_toolset(  # noqa: C901
         """Load full instructions for a skill.
 
         This loads the complete SKILL.md content including detailed instructions
-        on how to use the skill.
+        on how to use the skill. Instructions are read once and reused for the
+        rest of the session.
 
         Args:
             skill_name: Name of the skill to load.
@@ -291,11 +358,7 @@ def create_skills_toolset(  # noqa: C901
             return f"Error: Skill '{skill_name}' not found. Available skills: {available}"
 
         skill = _skills_cache[skill_name]
-        instructions = load_skill_instructions(skill["path"])
-
-        # Update cache with full instructions
-        skill["instructions"] = instructions
-        skill["frontmatter_loaded"] = False
+        instructions = _get_skill_instructions(skill)
 
         # Format response
         lines = [
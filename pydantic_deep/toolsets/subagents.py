@@ -89,6 +89,11 @@ def create_subagent_toolset(
         "\n".join(subagent_descriptions) if subagent_descriptions else "No subagents configured"
     )
 
+    # Resolve configs by name once; the first config wins on duplicate names
+    configs_by_name: dict[str, SubAgentConfig] = {
+        config["name"]: config for config in reversed(subagent_configs)
+    }
+
     toolset: FunctionToolset[DeepAgentDeps] = FunctionToolset(id=id)
 
     @toolset.tool
@@ -107,20 +112,15 @@ def create_subagent_toolset(
             subagent_type: Type of subagent to use (e.g., "general-purpose").
         """
         # Find the subagent config
-        config = None
-        for c in subagent_configs:
-            if c["name"] == subagent_type:
-                config = c
-                break
+        config = configs_by_name.get(subagent_type)
 
         if config is None:
             available = ", ".join(c["name"] for c in subagent_configs)
             return f"Error: Unknown subagent type '{subagent_type}'. Available: {available}"
 
         # Check if we have a pre-built agent
-        if subagent_type in ctx.deps.subagents:
-            subagent = ctx.deps.subagents[subagent_type]
-        else:
+        subagent = ctx.deps.subagents.get(subagent_type)
+        if subagent is None:
             # Create the subagent on-the-fly
             from pydantic_ai_todo import create_todo_toolset
 
@@ -181,18 +181,20 @@ def get_subagent_system_prompt(
     Returns:
         System prompt section for subagent tools.
     """
-    prompt = SUBAGENT_SYSTEM_PROMPT
+    parts = [SUBAGENT_SYSTEM_PROMPT]
 
     if subagent_configs:
-        prompt += "\n\n### Available Subagents\n"
-        for config in subagent_configs:
-            prompt += f"\n**{config['name']}**: {config['description'].strip()}\n"
+        parts.append("\n\n### Available Subagents\n")
+        parts.extend(
+            f"\n**{config['name']}**: {config['description'].strip()}\n"
+            for config in subagent_configs
+        )
 
     if deps.subagents:
-        prompt += "\n\n### Cached Subagents\n"
-        prompt += f"Active subagents: {', '.join(deps.subagents.keys())}\n"
+        parts.append("\n\n### Cached Subagents\n")
+        parts.append(f"Active subagents: {', '.join(deps.subagents.keys())}\n")
 
-    return prompt
+    return "".join(parts)
 
 
 # Alias for convenience
@@ -1,5 +1,6 @@
 """Extended tests for agent factory to reach 100% coverage."""
 
+from pydantic_ai.messages import ModelRequest
 from pydantic_ai.models.test import TestModel
 
 from pydantic_deep import (
@@ -7,6 +8,7 @@ from pydantic_deep import (
     StateBackend,
     create_deep_agent,
 )
+from pydantic_deep.toolsets import skills as skills_module
 from pydantic_deep.types import Skill, SkillDirectory
 
 TEST_MODEL = TestModel()
@@ -103,6 +105,72 @@ This is a test skill.
         )
         assert agent is not None
 
+    async def test_skill_directories_walked_once(self, tmp_path, monkeypatch):
+        """Test the skills toolset and prompt share a single discovery walk."""
+        skill_dir = tmp_path / "test-skill"
+        skill_dir.mkdir()
+        (skill_dir / "SKILL.md").write_text(
+            "---\nname: test-skill\ndescription: A test skill\n---\n\nSteps.\n"
+        )
+
+        walks: list[list[SkillDirectory]] = []
+        original_iter_skills = skills_module.iter_skills
+
+        def counting_iter_skills(directories, backend=None):
+            walks.append(directories)
+            return original_iter_skills(directories, backend)
+
+        monkeypatch.setattr(skills_module, "iter_skills", counting_iter_skills)
+
+        agent = create_deep_agent(
+            model=TestModel(call_tools=[]),
+            include_todo=False,
+            include_filesystem=False,
+            include_subagents=False,
+            skill_directories=[{"path": str(tmp_path), "recursive": True}],
+        )
+        assert len(walks) == 1
+
+        result = await agent.run("Hello", deps=DeepAgentDeps(backend=StateBackend()))
+        request = result.all_messages()[0]
+        assert isinstance(request, ModelRequest)
+        assert request.instructions is not None
+        assert "**test-skill**: A test skill" in request.instructions
+        assert len(walks) == 1
+
+    async def test_empty_skills_with_skill_directories(self, tmp_path, monkeypatch):
+        """Test explicit empty skills override skill directories in the prompt."""
+        skill_dir = tmp_path / "test-skill"
+        skill_dir.mkdir()
+        (skill_dir / "SKILL.md").write_text(
+            "---\nname: test-skill\ndescription: A test skill\n---\n\nSteps.\n"
+        )
+
+        walks: list[list[SkillDirectory]] = []
+        original_iter_skills = skills_module.iter_skills
+
+        def counting_iter_skills(directories, backend=None):
+            walks.append(directories)
+            return original_iter_skills(directories, backend)
+
+        monkeypatch.setattr(skills_module, "iter_skills", counting_iter_skills)
+
+        agent = create_deep_agent(
+            model=TestModel(call_tools=[]),
+            include_todo=False,
+            include_filesystem=False,
+            include_subagents=False,
+            skills=[],
+            skill_directories=[{"path": str(tmp_path), "recursive": True}],
+        )
+        assert walks == []
+
+        result = await agent.run("Hello", deps=DeepAgentDeps(backend=StateBackend()))
+        request = result.all_messages()[0]
+        assert isinstance(request, ModelRequest)
+        assert "Available Skills" not in (request.instructions or "")
+        assert "test-skill" not in (request.instructions or "")
+
     def test_create_with_interrupt_on_edit_file(self):
         """Test creating with edit_file in interrupt_on."""
         agent = create_deep_agent(
@@ -24,6 +24,7 @@ from pydantic_deep import (
 from pydantic_deep.processors.summarization import (
     _count_tokens_approximately,
     _format_messages_for_summary,
+    _index_tool_returns,
 )
 
 TEST_MODEL = TestModel()
@@ -310,6 +311,26 @@ class TestSummarizationProcessor:
         # Cutting after both is safe
         assert processor._is_safe_cutoff_point(messages, 2)
 
+    def test_is_safe_cutoff_point_with_tool_return_index(self):
+        """Test cutoff check with a prebuilt tool return index."""
+        processor = SummarizationProcessor(
+            model="openai:gpt-4.1",
+        )
+        messages: list[ModelMessage] = [
+            ModelRequest(parts=[UserPromptPart(content="Question")]),
+            ModelResponse(parts=[ToolCallPart(tool_name="test", args={}, tool_call_id="call_1")]),
+            ModelRequest(
+                parts=[ToolReturnPart(tool_name="test", content="Result", tool_call_id="call_1")]
+            ),
+            ModelResponse(parts=[TextPart(content="Answer")]),
+        ]
+        index = _index_tool_returns(messages)
+        assert index == {"call_1": [2]}
+
+        assert processor._is_safe_cutoff_point(messages, 1, index)
+        assert not processor._is_safe_cutoff_point(messages, 2, index)
+        assert processor._is_safe_cutoff_point(messages, 3, index)
+
     @pytest.mark.anyio
     async def test_call_no_summarization_needed(self):
         """Test processor returns messages unchanged when no summarization needed."""
@@ -1,11 +1,13 @@
 """Tests for skills toolset."""
 
 import tempfile
+from collections.abc import Iterator
 from pathlib import Path
 
 from pydantic_deep.toolsets.skills import (
     create_skills_toolset,
     discover_skills,
+    iter_skills,
     load_skill_instructions,
     parse_skill_md,
 )
@@ -189,6 +191,26 @@ Instructions
         skills = discover_skills([{"path": "/nonexistent/path"}])
         assert skills == []
 
+    def test_iter_skills_yields_lazily(self):
+        """Test iterating skills without building a list."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for name in ("first-skill", "second-skill"):
+                skill_dir = Path(tmpdir) / name
+                skill_dir.mkdir()
+                (skill_dir / "SKILL.md").write_text(
+                    f"---\nname: {name}\ndescription: {name} description\n---\n\nSteps.\n"
+                )
+
+            skills_iter = iter_skills([{"path": tmpdir}])
+            assert isinstance(skills_iter, Iterator)
+
+            first = next(skills_iter)
+            rest = list(skills_iter)
+
+            assert len(rest) == 1
+            names = {first["name"], rest[0]["name"]}
+            assert names == {"first-skill", "second-skill"}
+
 
 class TestLoadSkillInstructions:
     """Tests for loading skill instructions."""
@@ -4,6 +4,8 @@ from pydantic_ai_backends import StateBackend
 
 from pydantic_deep.deps import DeepAgentDeps
 from pydantic_deep.toolsets.skills import (
+    _format_skills_list,
+    _get_skill_instructions,
     create_skills_toolset,
     discover_skills,
     get_skills_system_prompt,
@@ -294,6 +296,92 @@ class TestGetSkillsSystemPrompt:
         # No tags section
 
 
+class TestFormatSkillsList:
+    """Tests for _format_skills_list function."""
+
+    def test_empty_skills(self):
+        """Test listing with no skills."""
+        assert _format_skills_list({}) == "No skills available."
+
+    def test_with_skills(self):
+        """Test listing is sorted and shows tags and resources."""
+        skills: dict[str, Skill] = {
+            "zeta": {
+                "name": "zeta",
+                "description": "Last skill",
+                "path": "/skills/zeta",
+                "tags": [],
+                "version": "1.0.0",
+                "author": "",
+                "frontmatter_loaded": True,
+            },
+            "alpha": {
+                "name": "alpha",
+                "description": "First skill",
+                "path": "/skills/alpha",
+                "tags": ["test", "example"],
+                "version": "2.0.0",
+                "author": "",
+                "frontmatter_loaded": True,
+                "resources": ["template.txt"],
+            },
+        }
+        listing = _format_skills_list(skills)
+
+        assert listing.index("**alpha** (v2.0.0)") < listing.index("**zeta** (v1.0.0)")
+        assert "Tags: test, example" in listing
+        assert "Tags: none" in listing
+        assert "Path: /skills/alpha (resources: template.txt)" in listing
+        assert "Path: /skills/zeta\n" in listing
+
+
+class TestGetSkillInstructions:
+    """Tests for _get_skill_instructions function."""
+
+    def _make_skill(self, path) -> Skill:
+        return {
+            "name": "test-skill",
+            "description": "Test",
+            "path": str(path),
+            "tags": [],
+            "version": "1.0.0",
+            "author": "",
+            "frontmatter_loaded": True,
+        }
+
+    def test_caches_loaded_instructions(self, tmp_path):
+        """Test a second load reuses the cached instructions."""
+        skill_file = tmp_path / "SKILL.md"
+        skill_file.write_text("---\nname: test-skill\n---\n\nOriginal steps.\n")
+        skill = self._make_skill(tmp_path)
+
+        assert _get_skill_instructions(skill) == "Original steps."
+        assert skill["instructions"] == "Original steps."
+        assert skill["frontmatter_loaded"] is False
+
+        skill_file.write_text("---\nname: test-skill\n---\n\nChanged steps.\n")
+        assert _get_skill_instructions(skill) == "Original steps."
+
+    def test_missing_file_not_cached(self, tmp_path):
+        """Test a missing SKILL.md is retried on the next load."""
+        skill = self._make_skill(tmp_path)
+
+        result = _get_skill_instructions(skill)
+        assert "not found" in result
+        assert "instructions" not in skill
+        assert skill["frontmatter_loaded"] is True
+
+        (tmp_path / "SKILL.md").write_text("---\nname: test-skill\n---\n\nSteps.\n")
+        assert _get_skill_instructions(skill) == "Steps."
+
+    def test_preloaded_instructions(self, tmp_path):
+        """Test pre-loaded instructions are returned without reading SKILL.md."""
+        skill = self._make_skill(tmp_path)
+        skill["instructions"] = "Inline steps."
+
+        assert _get_skill_instructions(skill) == "Inline steps."
+
+
 class TestCreateSkillsToolset:
     """Tests for create_skills_toolset function."""
 